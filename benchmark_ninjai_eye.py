@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+NinjaEye Benchmark Suite
+Offline microbenchmarks for the CPU hot paths with a regression gate
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from ninjai_eye import NinjaEye, OSINTResult
+
+BASELINE_FILE = Path(__file__).with_name('benchmark_baselines.json')
+DEFAULT_THRESHOLD = 0.25
+# Fast functions are looped until one sample lasts this long (seconds)
+MIN_SAMPLE = 0.2
+# Apparent regressions are re-measured this many times before failing
+CONFIRM_RUNS = 2
+
+def print_section(title):
+    """Print a formatted section header"""
+    print("\n" + "=" * 80)
+    print(f"  {title}")
+    print("=" * 80 + "\n")
+
+def make_page(size: int, title: str = "johndoe - User Profile", title_at_end: bool = False) -> str:
+    """
+    Build a synthetic profile page of roughly size bytes
+    With title_at_end the title sits after the body, so finding it means
+    scanning the whole page rather than the first few bytes.
+    """
+    title_tag = f"<title>{title}</title>"
+    head = "<html><head></head><body>" if title_at_end else f"<html><head>{title_tag}</head><body>"
+    tail = f"{title_tag}</body></html>" if title_at_end else "</body></html>"
+    block = (
+        '<div class="post"><a href="/johndoe/status/1">Post</a>'
+        '<span class="followers">1,024 followers</span>'
+        '<span class="following">512 following</span></div>\n'
+    )
+    body = block * max(1, (size - len(head)) // len(block))
+    return head + body + tail
+
+def make_results(count: int) -> list:
+    """Build username scan results like a large batch run would produce"""
+    timestamp = datetime.now().isoformat()
+    statuses = ['FOUND', 'MAYBE', 'NOT_FOUND', 'ERROR']
+    return [
+        OSINTResult(
+            source="github",
+            target=f"user{i}",
+            result_type="username_search",
+            status=statuses[i % 4],
+            confidence=85.5,
+            data={"url": f"https://github.com/user{i}", "status_code": 200,
+                  "response_time": 0.321, "title": "User profile"},
+            timestamp=timestamp,
+            metadata={"category": "professional", "method": "get"}
+        )
+        for i in range(count)
+    ]
+
+def measure(func, repeat: int, min_sample: float = MIN_SAMPLE) -> float:
+    """
+    Return the best per-call wall time of func over repeat samples
+    Fast functions are looped within each sample until it lasts at least
+    min_sample seconds, which keeps timer noise out of the comparison.
+    Garbage collection is paused while timing, as timeit does, so objects
+    left over from other benchmarks don't skew the result.
+    """
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(func, repeat, min_sample)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def _measure(func, repeat: int, min_sample: float) -> float:
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample:
+            break
+        number *= 10
+    
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+def build_benchmarks(full: bool = False) -> dict:
+    """
+    Map benchmark name to (setup, samples)
+    setup() builds the fixture and returns the callable to time, so large
+    fixtures only exist while their own benchmark runs
+    """
+    ninja = NinjaEye()
+    benchmarks = {}
+    
+    def confidence_setup(size):
+        response_data = {
+            'status_code': 200,
+            'content': make_page(size),
+            'response_time': 0.4,
+            'url': 'https://example.com/johndoe',
+            'title': 'johndoe - User Profile'
+        }
+        return lambda: ninja._calculate_confidence(response_data)
+    
+    for label, size in (('50kb', 50_000), ('500kb', 500_000), ('2mb', 2_000_000)):
+        benchmarks[f'calculate_confidence_{label}'] = (lambda size=size: confidence_setup(size), 5)
+    
+    def title_setup(missing):
+        page = make_page(500_000, title_at_end=True)
+        if missing:
+            page = page.replace('<title>', '<meta>').replace('</title>', '</meta>')
+        return lambda: ninja._extract_title(page)
+    
+    benchmarks['extract_title_end_500kb'] = (lambda: title_setup(False), 5)
+    benchmarks['extract_title_missing_500kb'] = (lambda: title_setup(True), 5)
+    
+    benchmarks['generate_username_variations'] = (
+        lambda: lambda: ninja.generate_username_variations('johndoe'), 5
+    )
+    
+    platform_names = [name for platforms in ninja.platforms.values() for name in platforms]
+    platform_names.append('not_a_platform')
+    benchmarks['get_platform_category'] = (
+        lambda: lambda: [ninja._get_platform_category(name) for name in platform_names * 100], 5
+    )
+    
+    def report_setup(count, output_format):
+        report_ninja = NinjaEye()
+        report_ninja.results = make_results(count)
+        return lambda: report_ninja.generate_report(output_format)
+    
+    sizes = [100_000, 1_000_000] if full else [100_000]
+    for count in sizes:
+        label = f"{count // 1000}k" if count < 1_000_000 else f"{count // 1_000_000}m"
+        for output_format in ('json', 'text'):
+            benchmarks[f'generate_report_{output_format}_{label}'] = (
+                lambda count=count, output_format=output_format: report_setup(count, output_format), 2
+            )
+    
+    return benchmarks
+
+def run_benchmarks(names=None, full: bool = False) -> dict:
+    """Run the selected benchmarks and return seconds per call"""
+    timings = {}
+    for name, (setup, repeat) in build_benchmarks(full).items():
+        if names and name not in names:
+            continue
+        func = setup()
+        timings[name] = measure(func, repeat)
+        # Drop the fixture before the next benchmark is built
+        del func
+        print(f"   {name:<36} {timings[name] * 1000:>12.3f} ms")
+    return timings
+
+def check_regressions(timings: dict, baselines: dict, threshold: float) -> list:
+    """Return (name, baseline, current) for every benchmark slower than allowed"""
+    regressions = []
+    for name, current in timings.items():
+        baseline = baselines.get(name)
+        if baseline and current > baseline * (1 + threshold):
+            regressions.append((name, baseline, current))
+    return regressions
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='NinjaEye hot path microbenchmarks')
+    parser.add_argument('--check', action='store_true',
+                       help='Fail if a benchmark is slower than its stored baseline by more than the threshold')
+    parser.add_argument('--save-baseline', action='store_true',
+                       help='Store the measured timings as the new baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                       help=f'Allowed slowdown as a fraction of the baseline (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--baseline-file', default=str(BASELINE_FILE),
+                       help='Baseline file (default: benchmark_baselines.json)')
+    parser.add_argument('--full', action='store_true',
+                       help='Include the 10^6 result report benchmarks')
+    parser.add_argument('--only', nargs='+', help='Run only the named benchmarks')
+    args = parser.parse_args()
+    
+    print_section("NinjaEye Hot Path Benchmarks")
+    timings = run_benchmarks(args.only, args.full)
+    
+    baseline_path = Path(args.baseline_file)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    
+    if args.save_baseline:
+        baselines.update(timings)
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\n💾 Baselines saved to: {baseline_path}")
+    
+    if args.check:
+        if not baselines:
+            print(f"\n❌ No baselines found in {baseline_path}; run with --save-baseline first")
+            sys.exit(1)
+        
+        regressions = check_regressions(timings, baselines, args.threshold)
+        for _ in range(CONFIRM_RUNS):
+            if not regressions:
+                break
+            # A real regression stays slow; a burst of machine load does not
+            print(f"\n🔁 Re-measuring {len(regressions)} benchmark(s) to rule out noise")
+            retimed = run_benchmarks([name for name, _, _ in regressions], args.full)
+            for name, current in retimed.items():
+                timings[name] = min(timings[name], current)
+            regressions = check_regressions(timings, baselines, args.threshold)
+        
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+            for name, baseline, current in regressions:
+                print(f"   {name}: {baseline * 1000:.3f} ms -> {current * 1000:.3f} ms "
+                      f"(+{current / baseline - 1:.0%})")
+            sys.exit(1)
+        
+        print(f"\n✅ No benchmark regressed by more than {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
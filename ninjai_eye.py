@@ -7,14 +7,16 @@ that surpasses Aliens_Eye in accuracy and capabilities.
 
 import asyncio
 import aiohttp
+from aiohttp import web
 import json
 import re
 import sys
 import argparse
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
+from collections import OrderedDict
 from pathlib import Path
 import hashlib
 import base64
@@ -24,8 +26,23 @@ from urllib.parse import urlparse, parse_qs
 import ipaddress
 import socket
 import ssl
+import uuid
+import csv
+import array
+import heapq
+import mmap
+import struct
+import tempfile
+import threading
 import whois
 
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 @dataclass
 class OSINTResult:
     """Data class for OSINT results"""
@@ -38,15 +55,468 @@ class OSINTResult:
     timestamp: str
     metadata: dict
 
+# E.164 country calling codes: code -> (ISO region, min NSN length, max NSN length)
+# NSN is the national significant number, i.e. everything after the country code
+COUNTRY_CALLING_CODES = {
+    '1': ('US', 10, 10), '7': ('RU', 10, 10),
+    '20': ('EG', 8, 10), '27': ('ZA', 9, 9), '30': ('GR', 10, 10), '31': ('NL', 9, 9),
+    '32': ('BE', 8, 9), '33': ('FR', 9, 9), '34': ('ES', 9, 9), '36': ('HU', 8, 9),
+    '39': ('IT', 6, 11), '40': ('RO', 9, 9), '41': ('CH', 9, 9), '43': ('AT', 4, 13),
+    '44': ('GB', 7, 10), '45': ('DK', 8, 8), '46': ('SE', 7, 13), '47': ('NO', 5, 8),
+    '48': ('PL', 9, 9), '49': ('DE', 5, 15), '51': ('PE', 8, 9), '52': ('MX', 10, 10),
+    '53': ('CU', 6, 8), '54': ('AR', 10, 11), '55': ('BR', 10, 11), '56': ('CL', 9, 9),
+    '57': ('CO', 8, 10), '58': ('VE', 10, 10), '60': ('MY', 7, 10), '61': ('AU', 9, 9),
+    '62': ('ID', 7, 12), '63': ('PH', 8, 10), '64': ('NZ', 8, 10), '65': ('SG', 8, 8),
+    '66': ('TH', 8, 9), '81': ('JP', 9, 10), '82': ('KR', 8, 10), '84': ('VN', 9, 10),
+    '86': ('CN', 5, 12), '90': ('TR', 10, 10), '91': ('IN', 10, 10), '92': ('PK', 9, 10),
+    '93': ('AF', 9, 9), '94': ('LK', 9, 9), '95': ('MM', 7, 10), '98': ('IR', 10, 10),
+    '211': ('SS', 9, 9), '212': ('MA', 9, 9), '213': ('DZ', 8, 9), '216': ('TN', 8, 8),
+    '218': ('LY', 9, 9), '220': ('GM', 7, 7), '221': ('SN', 9, 9), '222': ('MR', 8, 8),
+    '223': ('ML', 8, 8), '224': ('GN', 8, 9), '225': ('CI', 10, 10), '226': ('BF', 8, 8),
+    '227': ('NE', 8, 8), '228': ('TG', 8, 8), '229': ('BJ', 8, 10), '230': ('MU', 7, 8),
+    '231': ('LR', 7, 9), '232': ('SL', 8, 8), '233': ('GH', 9, 9), '234': ('NG', 8, 10),
+    '235': ('TD', 8, 8), '236': ('CF', 8, 8), '237': ('CM', 9, 9), '238': ('CV', 7, 7),
+    '239': ('ST', 7, 7), '240': ('GQ', 9, 9), '241': ('GA', 7, 8), '242': ('CG', 9, 9),
+    '243': ('CD', 9, 9), '244': ('AO', 9, 9), '245': ('GW', 7, 9), '246': ('IO', 7, 7),
+    '248': ('SC', 7, 7), '249': ('SD', 9, 9), '250': ('RW', 9, 9), '251': ('ET', 9, 9),
+    '252': ('SO', 7, 9), '253': ('DJ', 8, 8), '254': ('KE', 9, 10), '255': ('TZ', 9, 9),
+    '256': ('UG', 9, 9), '257': ('BI', 8, 8), '258': ('MZ', 8, 9), '260': ('ZM', 9, 9),
+    '261': ('MG', 9, 9), '262': ('RE', 9, 9), '263': ('ZW', 9, 9), '264': ('NA', 8, 9),
+    '265': ('MW', 7, 9), '266': ('LS', 8, 8), '267': ('BW', 7, 8), '268': ('SZ', 8, 8),
+    '269': ('KM', 7, 7), '290': ('SH', 4, 5), '291': ('ER', 7, 7), '297': ('AW', 7, 7),
+    '298': ('FO', 6, 6), '299': ('GL', 6, 6), '350': ('GI', 8, 8), '351': ('PT', 9, 9),
+    '352': ('LU', 4, 11), '353': ('IE', 7, 9), '354': ('IS', 7, 9), '355': ('AL', 8, 9),
+    '356': ('MT', 8, 8), '357': ('CY', 8, 8), '358': ('FI', 5, 12), '359': ('BG', 8, 9),
+    '370': ('LT', 8, 8), '371': ('LV', 8, 8), '372': ('EE', 7, 8), '373': ('MD', 8, 8),
+    '374': ('AM', 8, 8), '375': ('BY', 9, 10), '376': ('AD', 6, 9), '377': ('MC', 8, 9),
+    '378': ('SM', 6, 10), '380': ('UA', 9, 9), '381': ('RS', 8, 9), '382': ('ME', 8, 8),
+    '383': ('XK', 8, 8), '385': ('HR', 8, 9), '386': ('SI', 8, 8), '387': ('BA', 8, 8),
+    '389': ('MK', 8, 8), '420': ('CZ', 9, 9), '421': ('SK', 9, 9), '423': ('LI', 7, 9),
+    '500': ('FK', 5, 5), '501': ('BZ', 7, 7), '502': ('GT', 8, 8), '503': ('SV', 8, 8),
+    '504': ('HN', 8, 8), '505': ('NI', 8, 8), '506': ('CR', 8, 8), '507': ('PA', 7, 8),
+    '508': ('PM', 6, 6), '509': ('HT', 8, 8), '590': ('GP', 9, 9), '591': ('BO', 8, 8),
+    '592': ('GY', 7, 7), '593': ('EC', 8, 9), '594': ('GF', 9, 9), '595': ('PY', 9, 9),
+    '596': ('MQ', 9, 9), '597': ('SR', 6, 7), '598': ('UY', 8, 8), '599': ('CW', 7, 7),
+    '670': ('TL', 7, 8), '672': ('NF', 6, 6), '673': ('BN', 7, 7), '674': ('NR', 7, 7),
+    '675': ('PG', 7, 8), '676': ('TO', 5, 7), '677': ('SB', 5, 7), '678': ('VU', 5, 7),
+    '679': ('FJ', 7, 7), '680': ('PW', 7, 7), '681': ('WF', 6, 6), '682': ('CK', 5, 5),
+    '683': ('NU', 4, 7), '685': ('WS', 5, 10), '686': ('KI', 5, 8), '687': ('NC', 6, 6),
+    '688': ('TV', 5, 7), '689': ('PF', 8, 8), '690': ('TK', 4, 7), '691': ('FM', 7, 7),
+    '692': ('MH', 7, 7), '850': ('KP', 8, 10), '852': ('HK', 8, 8), '853': ('MO', 8, 8),
+    '855': ('KH', 8, 9), '856': ('LA', 8, 10), '880': ('BD', 10, 10), '886': ('TW', 8, 9),
+    '960': ('MV', 7, 7), '961': ('LB', 7, 8), '962': ('JO', 8, 9), '963': ('SY', 8, 9),
+    '964': ('IQ', 8, 10), '965': ('KW', 8, 8), '966': ('SA', 9, 9), '967': ('YE', 7, 9),
+    '968': ('OM', 8, 8), '970': ('PS', 9, 9), '971': ('AE', 8, 9), '972': ('IL', 8, 9),
+    '973': ('BH', 8, 8), '974': ('QA', 8, 8), '975': ('BT', 7, 8), '976': ('MN', 8, 8),
+    '977': ('NP', 8, 10), '992': ('TJ', 9, 9), '993': ('TM', 8, 8), '994': ('AZ', 9, 9),
+    '995': ('GE', 9, 9), '996': ('KG', 9, 9), '998': ('UZ', 9, 9),
+}
+
+# Leading NSN digits reserved for mobile numbers in countries with a
+# separate mobile range; other numbers in these countries are landlines
+MOBILE_PREFIXES = {
+    '20': ('1',), '27': ('6', '7', '8'), '31': ('6',), '32': ('4',), '33': ('6', '7'),
+    '34': ('6', '7'), '39': ('3',), '41': ('7',), '43': ('6',), '44': ('7',),
+    '46': ('7',), '47': ('4', '9'), '49': ('15', '16', '17'), '60': ('1',),
+    '61': ('4',), '62': ('8',), '63': ('9',), '66': ('6', '8', '9'), '7': ('9',),
+    '81': ('70', '80', '90'), '82': ('10',), '84': ('3', '5', '7', '8', '9'),
+    '86': ('1',), '90': ('5',), '91': ('6', '7', '8', '9'), '92': ('3',),
+    '234': ('7', '8', '9'), '254': ('1', '7'), '351': ('9',), '353': ('8',),
+    '966': ('5',), '971': ('5',), '972': ('5',),
+}
+
+# Country codes whose numbering plans don't separate mobile from landline
+SHARED_MOBILE_RANGES = {'1', '52'}
+
+def _build_country_code_trie(codes: Dict[str, tuple]) -> dict:
+    """Build a digit trie over country codes; terminal nodes hold the code under None"""
+    trie = {}
+    for code in codes:
+        node = trie
+        for digit in code:
+            node = node.setdefault(digit, {})
+        node[None] = code
+    return trie
+
+COUNTRY_CODE_TRIE = _build_country_code_trie(COUNTRY_CALLING_CODES)
+PHONE_STRIP_PATTERN = re.compile(r'[^\d+]')
+TITLE_PATTERN = re.compile(r'<title>(.*?)</title>', re.IGNORECASE)
+
+# Flat columns written by the columnar report formats
+EXPORT_COLUMNS = ['target', 'source', 'category', 'status', 'confidence',
+                  'status_code', 'response_time', 'timestamp']
+COLUMNAR_FORMATS = ('csv', 'parquet', 'arrow')
+
+class BreachIndex:
+    """
+    Offline breach lookup over a sorted, fixed-width file of hashed identifiers
+    
+    File layout (little-endian):
+      header   magic, record count, metadata length, flags
+      metadata JSON list of breaches, padded to 8 bytes
+      prefix   optional table of 65537 record offsets keyed on the first
+               two digest bytes, narrowing each search to one bucket
+      records  SHA-256 digest of the normalized identifier + uint16 breach id,
+               sorted by digest
+    The file is memory-mapped, so corpora larger than RAM can be searched.
+    """
+    
+    MAGIC = b'NEBIDX01'
+    HEADER = struct.Struct('<8sQIB3x')
+    DIGEST_SIZE = 32
+    RECORD = struct.Struct('<32sH')
+    PREFIX_ENTRIES = 65537
+    FLAG_PREFIX_INDEX = 1
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, self.count, meta_length, flags = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a NinjaEye breach index")
+        
+        offset = self.HEADER.size
+        self.breaches = json.loads(self._mm[offset:offset + meta_length])
+        offset += self._padded(meta_length)
+        
+        self._prefix = None
+        if flags & self.FLAG_PREFIX_INDEX:
+            self._prefix = array.array('Q')
+            self._prefix.frombytes(self._mm[offset:offset + self.PREFIX_ENTRIES * 8])
+            if sys.byteorder == 'big':
+                self._prefix.byteswap()
+            offset += self.PREFIX_ENTRIES * 8
+        
+        self._records_offset = offset
+    
+    @staticmethod
+    def _padded(length: int) -> int:
+        return (length + 7) // 8 * 8
+    
+    @staticmethod
+    def digest(identifier: str) -> bytes:
+        """Hash an identifier the same way the index was built"""
+        return hashlib.sha256(identifier.strip().lower().encode()).digest()
+    
+    def lookup(self, identifier: str) -> List[dict]:
+        """Return the breaches an identifier appears in"""
+        digest = self.digest(identifier)
+        mm = self._mm
+        base = self._records_offset
+        record_size = self.RECORD.size
+        
+        if self._prefix is not None:
+            bucket = (digest[0] << 8) | digest[1]
+            lo, hi = self._prefix[bucket], self._prefix[bucket + 1]
+        else:
+            lo, hi = 0, self.count
+        
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = base + mid * record_size
+            if mm[offset:offset + self.DIGEST_SIZE] < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        breaches = []
+        offset = base + lo * record_size
+        while lo < self.count and mm[offset:offset + self.DIGEST_SIZE] == digest:
+            _, breach_id = self.RECORD.unpack_from(mm, offset)
+            breaches.append(dict(self.breaches[breach_id]))
+            lo += 1
+            offset += record_size
+        return breaches
+    
+    def close(self):
+        self._mm.close()
+        self._file.close()
+    
+    @classmethod
+    def build(cls, output_path: str, sources: List[Tuple[dict, Iterable[str]]],
+              prefix_index: bool = True, chunk_records: int = 1_000_000) -> int:
+        """
+        Build an index from (breach metadata, identifiers) pairs
+        Records are sorted in chunk_records runs on disk and merged, so the
+        corpus never has to fit in memory. Returns the number of records.
+        """
+        breaches = []
+        runs = []
+        chunk = []
+        
+        def flush():
+            chunk.sort()
+            run = tempfile.TemporaryFile()
+            run.write(b''.join(chunk))
+            run.seek(0)
+            runs.append(run)
+            chunk.clear()
+        
+        for breach_id, (breach, identifiers) in enumerate(sources):
+            records = 0
+            for identifier in identifiers:
+                if not identifier.strip():
+                    continue
+                chunk.append(cls.RECORD.pack(cls.digest(identifier), breach_id))
+                records += 1
+                if len(chunk) >= chunk_records:
+                    flush()
+            breaches.append(dict(breach, records=records))
+        if chunk:
+            flush()
+        
+        def read_run(run):
+            while True:
+                record = run.read(cls.RECORD.size)
+                if not record:
+                    return
+                yield record
+        
+        meta = json.dumps(breaches).encode()
+        prefix_counts = array.array('Q', [0]) * cls.PREFIX_ENTRIES
+        count = 0
+        
+        with open(output_path, 'wb') as out:
+            out.write(cls.HEADER.pack(cls.MAGIC, 0, len(meta), cls.FLAG_PREFIX_INDEX if prefix_index else 0))
+            out.write(meta.ljust(cls._padded(len(meta)), b'\0'))
+            prefix_offset = out.tell()
+            if prefix_index:
+                out.write(b'\0' * (cls.PREFIX_ENTRIES * 8))
+            
+            previous = None
+            for record in heapq.merge(*(read_run(run) for run in runs)):
+                if record == previous:
+                    continue
+                out.write(record)
+                prefix_counts[(record[0] << 8) | record[1]] += 1
+                previous = record
+                count += 1
+            
+            if prefix_index:
+                # Turn per-bucket counts into starting record offsets
+                starts = array.array('Q', [0]) * cls.PREFIX_ENTRIES
+                for bucket in range(1, cls.PREFIX_ENTRIES):
+                    starts[bucket] = starts[bucket - 1] + prefix_counts[bucket - 1]
+                if sys.byteorder == 'big':
+                    starts.byteswap()
+                out.seek(prefix_offset)
+                out.write(starts.tobytes())
+            
+            out.seek(0)
+            out.write(cls.HEADER.pack(cls.MAGIC, count, len(meta), cls.FLAG_PREFIX_INDEX if prefix_index else 0))
+        
+        for run in runs:
+            run.close()
+        return count
+
+class ResolutionCache:
+    """
+    Size-bounded TTL cache shared by DNS, host and WHOIS lookups
+    Entries expire on wall-clock time so they stay valid when persisted
+    to disk and reloaded by a later run
+    """
+    
+    MISSING = object()
+    
+    def __init__(self, max_entries: int = 10000, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+    
+    def get(self, key: str):
+        """Return a live cached value or MISSING"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return self.MISSING
+    
+    def set(self, key: str, value, ttl: float):
+        """Cache a value for ttl seconds, evicting the least recently used entries"""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0.0
+        }
+    
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, (expires, value) in entries.items():
+            if expires > now:
+                self._entries[key] = (expires, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def save(self):
+        """Write live entries to the cache file, if one is configured"""
+        if not self.path:
+            return
+        now = time.time()
+        with self._lock:
+            entries = {key: list(entry) for key, entry in self._entries.items() if entry[0] > now}
+        try:
+            path = Path(self.path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(entries, f, default=str)
+        except OSError:
+            pass
+
+class ResultExporter:
+    """
+    Write results as flat columns (csv, parquet or arrow) as they arrive
+    Rows are buffered and flushed chunk_size at a time, so results pushed
+    from a streaming scan are exported in bounded memory
+    """
+    
+    def __init__(self, filename: str, output_format: str = 'csv', chunk_size: int = 50000):
+        if output_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {output_format}")
+        if output_format != 'csv' and pyarrow is None:
+            raise RuntimeError(f"{output_format} export requires pyarrow (pip install pyarrow)")
+        
+        self.filename = filename
+        self.output_format = output_format
+        self.chunk_size = chunk_size
+        self.written = 0
+        self._rows = []
+        
+        if output_format == 'csv':
+            self._file = open(filename, 'w', newline='')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(EXPORT_COLUMNS)
+            return
+        
+        self._schema = pyarrow.schema([
+            ('target', pyarrow.string()),
+            ('source', pyarrow.string()),
+            ('category', pyarrow.string()),
+            ('status', pyarrow.string()),
+            ('confidence', pyarrow.float64()),
+            ('status_code', pyarrow.int32()),
+            ('response_time', pyarrow.float64()),
+            ('timestamp', pyarrow.timestamp('us')),
+        ])
+        if output_format == 'parquet':
+            self._writer = pyarrow.parquet.ParquetWriter(filename, self._schema)
+        else:
+            self._writer = pyarrow.ipc.new_file(filename, self._schema)
+    
+    def write(self, result: OSINTResult):
+        """Buffer one result, flushing a chunk when the buffer is full"""
+        self._rows.append(self._row(result))
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+    
+    def flush(self):
+        """Write the buffered rows"""
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        
+        if self.output_format == 'csv':
+            self._writer.writerows(rows)
+        else:
+            columns = list(zip(*rows))
+            columns[-1] = [datetime.fromisoformat(value) for value in columns[-1]]
+            batch = pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(column, type=self._schema.field(i).type) for i, column in enumerate(columns)],
+                schema=self._schema
+            )
+            self._writer.write_batch(batch)
+        self.written += len(rows)
+    
+    def close(self):
+        """Flush what is left and finish the file"""
+        try:
+            self.flush()
+        finally:
+            if self.output_format == 'csv':
+                self._file.close()
+            else:
+                self._writer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @staticmethod
+    def _row(result: OSINTResult) -> tuple:
+        """Flatten a result into EXPORT_COLUMNS order"""
+        return (
+            result.target,
+            result.source,
+            result.metadata.get('category', result.result_type),
+            result.status,
+            result.confidence,
+            result.data.get('status_code'),
+            result.data.get('response_time'),
+            result.timestamp
+        )
+
 class NinjaEye:
     """Main OSINT Framework Class"""
     
-    def __init__(self, max_concurrent: int = 50, timeout: int = 10):
+    # Answers without a TTL of their own: negative DNS answers and host lookups
+    NEGATIVE_DNS_TTL = 60
+    HOST_TTL = 60
+    
+    # Adaptive timeouts: p99 of the last LATENCY_WINDOW probes times the margin,
+    # clamped between the floor and the configured timeout
+    LATENCY_WINDOW = 100
+    ADAPTIVE_MIN_SAMPLES = 10
+    ADAPTIVE_PERCENTILE = 0.99
+    ADAPTIVE_MARGIN = 1.5
+    ADAPTIVE_FLOOR = 1.0
+    
+    def __init__(self, max_concurrent: int = 50, timeout: int = 10, history_file: Optional[str] = None,
+                 breach_index: Optional[str] = None, cache_file: Optional[str] = None,
+                 cache_size: int = 10000, whois_ttl: float = 86400, adaptive_timeouts: bool = True):
         self.max_concurrent = max_concurrent
         self.timeout = timeout
         self.results = []
         self.session = None
         self.platforms = self._load_platforms()
+        self._inflight = {}
+        self.history_file = history_file
+        self.platform_stats = self._load_platform_stats()
+        self.breach_index = BreachIndex(breach_index) if breach_index else None
+        self.resolution_cache = ResolutionCache(cache_size, cache_file)
+        self.whois_ttl = whois_ttl
+        self.adaptive_timeouts = adaptive_timeouts
+        self.watch_errors = 0
         
     def _load_platforms(self) -> Dict:
         """Load platform configurations"""
@@ -102,12 +572,41 @@ class NinjaEye:
             'Connection': 'keep-alive',
         }
         timeout = aiohttp.ClientTimeout(total=self.timeout)
-        self.session = aiohttp.ClientSession(headers=headers, timeout=timeout)
+        # Pooled connector so keep-alive connections and DNS answers are reused
+        # across scans when the session is kept open (e.g. in serve mode)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent, ttl_dns_cache=300)
+        # Time connection set-up on its own so its limit is learned separately
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self.session = aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector,
+                                             trace_configs=[trace_config])
+    
+    @staticmethod
+    async def _on_connection_create_start(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx['connect_start'] = time.time()
+    
+    @staticmethod
+    async def _on_connection_create_end(session, context, params):
+        timing = context.trace_request_ctx
+        if timing is not None and 'connect_start' in timing:
+            timing['connect'] = time.time() - timing['connect_start']
     
     async def _close_session(self):
         """Close aiohttp session"""
         if self.session:
             await self.session.close()
+            self.session = None
+    
+    async def start(self):
+        """Open a long-lived session that scans reuse until close() is called"""
+        if self.session is None or self.session.closed:
+            await self._create_session()
+    
+    async def close(self):
+        """Close the long-lived session opened by start()"""
+        await self._close_session()
     
     def _calculate_confidence(self, response_data: dict) -> float:
         """
@@ -165,31 +664,138 @@ class NinjaEye:
         
         return round(confidence, 2)
     
-    async def _check_platform(self, platform_name: str, platform_config: dict, username: str) -> OSINTResult:
-        """Check a single platform for username existence"""
-        url_template = platform_config['url']
-        url = url_template.format(username)
-        
+    async def _fetch(self, url: str, timeout: Optional[aiohttp.ClientTimeout] = None,
+                     headers: Optional[dict] = None, platform_name: Optional[str] = None) -> dict:
+        """
+        Fetch a URL and collect the response fields used for scoring
+        With platform_name, the request's connect, first byte and total times
+        are added to that platform's latency window
+        """
         start_time = time.time()
+        # Filled in by the connection trace hooks when a new connection is opened
+        timing = {}
         
         try:
-            async with self.session.get(url) as response:
+            async with self.session.get(url, timeout=timeout, headers=headers,
+                                        trace_request_ctx=timing) as response:
                 response_time = time.time() - start_time
                 content = await response.text()
-                
-                # Extract title if available
-                title_match = re.search(r'<title>(.*?)</title>', content, re.IGNORECASE)
-                title = title_match.group(1) if title_match else ''
-                
-                response_data = {
-                    'status_code': response.status,
-                    'content': content,
-                    'response_time': response_time,
-                    'url': url,
-                    'title': title,
-                    'headers': dict(response.headers)
-                }
-                
+                total_time = time.time() - start_time
+                response_headers = dict(response.headers)
+                status_code = response.status
+        except asyncio.TimeoutError:
+            if platform_name:
+                # Censored sample at the applied limit so timeouts widen the learned limits
+                limit = timeout.total if timeout else self.timeout
+                connect = timing.get('connect')
+                if connect is None and 'connect_start' in timing:
+                    connect = time.time() - timing['connect_start']
+                self._record_latency(platform_name, connect, limit, limit)
+            raise
+        
+        if platform_name:
+            self._record_latency(platform_name, timing.get('connect'), response_time, total_time)
+        
+        return {
+            'status_code': status_code,
+            'content': content,
+            'response_time': response_time,
+            'total_time': total_time,
+            'url': url,
+            'title': self._extract_title(content),
+            'headers': response_headers
+        }
+    
+    def _extract_title(self, content: str) -> str:
+        """Extract the page title if available"""
+        title_match = TITLE_PATTERN.search(content)
+        return title_match.group(1) if title_match else ''
+    
+    async def _fetch_coalesced(self, url: str, timeout: Optional[aiohttp.ClientTimeout] = None,
+                               headers: Optional[dict] = None, platform_name: Optional[str] = None) -> dict:
+        """
+        Fetch a URL, sharing one in-flight request between concurrent callers
+        Overlapping categories and concurrent jobs often probe the same URL;
+        the shared request adds a single latency sample for platform_name
+        """
+        # Conditional requests only share a fetch when their validators match
+        key = (url, tuple(sorted(headers.items()))) if headers else url
+        entry = self._inflight.get(key)
+        if entry is None or entry[0].done():
+            future = asyncio.ensure_future(self._fetch(url, timeout, headers, platform_name))
+            # [shared future, number of callers still waiting on it]
+            entry = [future, 0]
+            self._inflight[key] = entry
+            
+            def _release(done):
+                current = self._inflight.get(key)
+                if current is not None and current[0] is done:
+                    del self._inflight[key]
+                # Mark the exception retrieved in case every caller was cancelled
+                if not done.cancelled():
+                    done.exception()
+            
+            future.add_done_callback(_release)
+        
+        future = entry[0]
+        entry[1] += 1
+        try:
+            # Shield so one cancelled caller doesn't cancel the fetch for the others
+            return await asyncio.shield(future)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not future.done():
+                future.cancel()
+    
+    async def _check_platform(self, platform_name: str, platform_config: dict, username: str,
+                              previous: Optional[dict] = None) -> OSINTResult:
+        """
+        Check a single platform for username existence
+        
+        previous, if given, is the profile's last watch state. The request is
+        then made conditional on its ETag/Last-Modified, and scoring is skipped
+        when the server answers 304 or the content digest is unchanged.
+        """
+        url_template = platform_config['url']
+        url = url_template.format(username)
+        timeout = self._platform_timeout(platform_name)
+        
+        headers = None
+        if previous:
+            headers = {}
+            if previous.get('etag'):
+                headers['If-None-Match'] = previous['etag']
+            if previous.get('last_modified'):
+                headers['If-Modified-Since'] = previous['last_modified']
+        
+        started = time.time()
+        try:
+            response_data = await self._fetch_coalesced(url, timeout, headers, platform_name)
+            
+            data = {
+                'url': url,
+                'status_code': response_data['status_code'],
+                'response_time': round(response_data['response_time'], 3),
+                'title': response_data['title']
+            }
+            
+            unchanged = False
+            if previous is not None:
+                response_headers = {name.lower(): value for name, value in response_data['headers'].items()}
+                data['etag'] = response_headers.get('etag') or previous.get('etag')
+                data['last_modified'] = response_headers.get('last-modified') or previous.get('last_modified')
+                if response_data['status_code'] == 304 and previous:
+                    data['digest'] = previous.get('digest')
+                    unchanged = True
+                else:
+                    data['digest'] = hashlib.sha256(response_data['content'].encode()).hexdigest()
+                    unchanged = bool(previous) and data['digest'] == previous.get('digest')
+                data['unchanged'] = unchanged
+            
+            if unchanged:
+                status = previous['status']
+                confidence = previous['confidence']
+            else:
                 confidence = self._calculate_confidence(response_data)
                 
                 # Determine status based on confidence
@@ -199,26 +805,22 @@ class NinjaEye:
                     status = 'MAYBE'
                 else:
                     status = 'NOT_FOUND'
-                
-                result = OSINTResult(
-                    source=platform_name,
-                    target=username,
-                    result_type='username_search',
-                    status=status,
-                    confidence=confidence,
-                    data={
-                        'url': url,
-                        'status_code': response.status,
-                        'response_time': round(response_time, 3),
-                        'title': title
-                    },
-                    timestamp=datetime.now().isoformat(),
-                    metadata={
-                        'category': self._get_platform_category(platform_name),
-                        'method': platform_config['method']
-                    }
-                )
-                
+            
+            result = OSINTResult(
+                source=platform_name,
+                target=username,
+                result_type='username_search',
+                status=status,
+                confidence=confidence,
+                data=data,
+                timestamp=datetime.now().isoformat(),
+                metadata={
+                    'category': self._get_platform_category(platform_name),
+                    'method': platform_config['method'],
+                    'timeout': round(timeout.total if timeout else self.timeout, 3)
+                }
+            )
+            
         except Exception as e:
             result = OSINTResult(
                 source=platform_name,
@@ -226,7 +828,7 @@ class NinjaEye:
                 result_type='username_search',
                 status='ERROR',
                 confidence=0.0,
-                data={'error': str(e)},
+                data={'error': str(e), 'elapsed': round(time.time() - started, 3)},
                 timestamp=datetime.now().isoformat(),
                 metadata={'category': 'unknown'}
             )
@@ -240,37 +842,429 @@ class NinjaEye:
                 return category
         return 'unknown'
     
-    async def scan_username(self, username: str, categories: List[str] = None) -> List[OSINTResult]:
+    async def scan_username(self, username: str, categories: List[str] = None,
+                            on_result: Optional[Callable[[OSINTResult], None]] = None,
+                            deadline: Optional[float] = None) -> List[OSINTResult]:
         """
         Scan username across multiple platforms
         More comprehensive than Aliens_Eye with better categorization
+        
+        on_result, if given, is called with each result as soon as it completes.
+        A session opened with start() is reused and left open.
+        With a deadline (seconds), fast high-yield platforms are probed first and
+        probes still running when it expires are reported as TIMEOUT_BUDGET.
         """
         if categories is None:
             categories = list(self.platforms.keys())
         
-        await self._create_session()
+        owns_session = self.session is None or self.session.closed
+        if owns_session:
+            await self._create_session()
         
-        tasks = []
+        probes = []
         for category in categories:
             if category in self.platforms:
                 for platform_name, platform_config in self.platforms[category].items():
-                    task = self._check_platform(platform_name, platform_config, username)
-                    tasks.append(task)
+                    probes.append((platform_name, platform_config))
         
-        # Execute tasks concurrently with semaphore
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        if deadline is not None:
+            probes.sort(key=lambda probe: self._platform_priority(probe[0]), reverse=True)
         
-        async def bounded_task(task):
-            async with semaphore:
-                return await task
+        async def probe(platform_name, platform_config):
+            result = await self._check_platform(platform_name, platform_config, username)
+            self._record_probe(result)
+            if on_result:
+                on_result(result)
+            return result
         
-        results = await asyncio.gather(*[bounded_task(task) for task in tasks])
+        try:
+            if deadline is None:
+                results = [None] * len(probes)
+                
+                async def handle(item):
+                    index, (platform_name, platform_config) = item
+                    results[index] = await probe(platform_name, platform_config)
+                
+                await self._run_worker_pool(enumerate(probes), handle, self.max_concurrent)
+            else:
+                # Deadline scans need one task per probe so stragglers can be cancelled
+                semaphore = asyncio.Semaphore(self.max_concurrent)
+                
+                async def bounded_task(platform_name, platform_config):
+                    async with semaphore:
+                        return await probe(platform_name, platform_config)
+                
+                results = await self._run_with_deadline(probes, bounded_task, username, deadline, on_result)
+        finally:
+            if owns_session:
+                await self._close_session()
         self.results.extend(results)
+        self._save_platform_stats()
         
-        await self._close_session()
+        return results
+    
+    async def scan_stream(self, usernames: Iterable[str], sink: Callable[[OSINTResult], None],
+                          categories: List[str] = None, workers: Optional[int] = None,
+                          queue_size: Optional[int] = None, deadline: Optional[float] = None) -> int:
+        """
+        Scan many usernames with a fixed pool of workers and constant memory
+        Probes are generated lazily from usernames, so the input can be a file
+        or generator of any size; each result is handed to sink and not kept on
+        self.results. Returns the number of results produced.
+        With a deadline (seconds), each username gets its own budget from its
+        first probe: fast high-yield platforms go first and probes still
+        running when it expires are reported as TIMEOUT_BUDGET.
+        """
+        if categories is None:
+            categories = list(self.platforms.keys())
         
+        platforms = [
+            (platform_name, platform_config)
+            for category in categories if category in self.platforms
+            for platform_name, platform_config in self.platforms[category].items()
+        ]
+        if deadline is not None:
+            platforms.sort(key=lambda probe: self._platform_priority(probe[0]), reverse=True)
+        
+        probes = (
+            (index, username, platform_name, platform_config)
+            for index, username in enumerate(usernames)
+            for platform_name, platform_config in platforms
+        )
+        # Per-username [budget start, probes left], dropped after the last probe
+        budgets = {}
+        count = 0
+        
+        async def handle(item):
+            nonlocal count
+            index, username, platform_name, platform_config = item
+            if deadline is None:
+                result = await self._check_platform(platform_name, platform_config, username)
+            else:
+                budget = budgets.setdefault(index, [time.time(), len(platforms)])
+                remaining = deadline - (time.time() - budget[0])
+                try:
+                    result = await asyncio.wait_for(
+                        self._check_platform(platform_name, platform_config, username), max(0, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    result = self._budget_result(platform_name, platform_config, username, deadline,
+                                                 time.time() - budget[0])
+                budget[1] -= 1
+                if budget[1] == 0:
+                    del budgets[index]
+            self._record_probe(result)
+            sink(result)
+            count += 1
+        
+        owns_session = self.session is None or self.session.closed
+        if owns_session:
+            await self._create_session()
+        try:
+            await self._run_worker_pool(probes, handle, workers or self.max_concurrent, queue_size)
+        finally:
+            if owns_session:
+                await self._close_session()
+        self._save_platform_stats()
+        
+        return count
+    
+    async def watch_usernames(self, usernames: Iterable[str], categories: List[str] = None,
+                              state_file: Optional[str] = None) -> List[OSINTResult]:
+        """
+        Re-check a watchlist and return only profiles whose status changed
+        The last status, ETag/Last-Modified and content digest of every
+        profile are kept in state_file so the next pass can send conditional
+        requests and skip scoring unchanged pages. Errors keep the old state
+        and are counted in watch_errors for the pass.
+        Each returned result carries previous_status in its metadata.
+        """
+        if categories is None:
+            categories = list(self.platforms.keys())
+        
+        # A platform listed under several categories is only checked once
+        platforms = {}
+        for category in categories:
+            platforms.update(self.platforms.get(category, {}))
+        
+        state = self._load_watch_state(state_file)
+        transitions = []
+        self.watch_errors = 0
+        
+        async def handle(item):
+            username, platform_name, platform_config = item
+            key = f"{platform_name}:{username}"
+            previous = state.get(key, {})
+            result = await self._check_platform(platform_name, platform_config, username, previous)
+            self._record_probe(result)
+            if result.status == 'ERROR':
+                self.watch_errors += 1
+                return
+            
+            state[key] = {
+                'status': result.status,
+                'confidence': result.confidence,
+                'etag': result.data.get('etag'),
+                'last_modified': result.data.get('last_modified'),
+                'digest': result.data.get('digest'),
+                'checked': result.timestamp
+            }
+            if previous.get('status') != result.status:
+                result.metadata['previous_status'] = previous.get('status')
+                transitions.append(result)
+        
+        probes = (
+            (username, platform_name, platform_config)
+            for username in usernames
+            for platform_name, platform_config in platforms.items()
+        )
+        
+        owns_session = self.session is None or self.session.closed
+        if owns_session:
+            await self._create_session()
+        try:
+            await self._run_worker_pool(probes, handle, self.max_concurrent)
+        finally:
+            if owns_session:
+                await self._close_session()
+            self._save_watch_state(state_file, state)
+        self._save_platform_stats()
+        
+        self.results.extend(transitions)
+        return transitions
+    
+    def _load_watch_state(self, state_file: Optional[str]) -> Dict:
+        """Load per-profile watch state"""
+        if not state_file:
+            return {}
+        try:
+            with open(state_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_watch_state(self, state_file: Optional[str], state: Dict):
+        """Persist per-profile watch state"""
+        if not state_file:
+            return
+        try:
+            path = Path(state_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(state, f)
+        except OSError:
+            pass
+    
+    async def _run_worker_pool(self, items: Iterable, handle, workers: int, queue_size: Optional[int] = None):
+        """
+        Run handle(item) for every item on a fixed pool of long-lived workers
+        Items are pulled lazily into a bounded queue, so the feeder waits
+        whenever the workers fall behind instead of materializing all work
+        """
+        queue = asyncio.Queue(maxsize=queue_size or workers * 2)
+        
+        async def feed():
+            for item in items:
+                await queue.put(item)
+            for _ in range(workers):
+                await queue.put(None)
+        
+        async def work():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                await handle(item)
+        
+        tasks = [asyncio.ensure_future(feed())] + [asyncio.ensure_future(work()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _run_with_deadline(self, probes: list, bounded_task, username: str, deadline: float,
+                                 on_result: Optional[Callable[[OSINTResult], None]]) -> List[OSINTResult]:
+        """Run probes until the deadline, then cancel stragglers"""
+        tasks = [asyncio.ensure_future(bounded_task(*probe)) for probe in probes]
+        started = time.time()
+        if tasks:
+            await asyncio.wait(tasks, timeout=max(0, deadline))
+        elapsed = time.time() - started
+        
+        results = []
+        for (platform_name, platform_config), task in zip(probes, tasks):
+            if task.done():
+                results.append(task.result())
+                continue
+            
+            task.cancel()
+            result = self._budget_result(platform_name, platform_config, username, deadline, elapsed)
+            # Censored sample: a miss that took at least the whole budget, so
+            # hosts that keep missing the deadline sink in the probe order
+            self._record_probe(result)
+            if on_result:
+                on_result(result)
+            results.append(result)
+        
+        await asyncio.gather(*tasks, return_exceptions=True)
         return results
     
+    def _budget_result(self, platform_name: str, platform_config: dict, username: str,
+                       deadline: float, elapsed: float) -> OSINTResult:
+        """Result for a probe cut off by the scan deadline"""
+        return OSINTResult(
+            source=platform_name,
+            target=username,
+            result_type='username_search',
+            status='TIMEOUT_BUDGET',
+            confidence=0.0,
+            data={
+                'url': platform_config['url'].format(username),
+                'error': f'Scan deadline of {deadline:g}s reached',
+                'elapsed': round(elapsed, 3)
+            },
+            timestamp=datetime.now().isoformat(),
+            metadata={
+                'category': self._get_platform_category(platform_name),
+                'method': platform_config['method']
+            }
+        )
+    
+    def _record_probe(self, result: OSINTResult):
+        """Update historical hit rate and latency for a platform"""
+        stats = self.platform_stats.setdefault(result.source, {'probes': 0, 'hits': 0, 'errors': 0, 'total_time': 0.0})
+        stats['probes'] += 1
+        if result.status in ('FOUND', 'MAYBE'):
+            stats['hits'] += 1
+        if result.status == 'ERROR':
+            stats['errors'] += 1
+        if result.status in ('ERROR', 'TIMEOUT_BUDGET'):
+            # Time actually spent before the failure or cut-off
+            stats['total_time'] += result.data.get('elapsed', 0.0)
+        else:
+            stats['total_time'] += result.data.get('response_time', 0.0)
+    
+    def _record_latency(self, platform_name: str, connect: Optional[float], first_byte: float, total: float):
+        """
+        Add a latency sample to the platform's rolling window
+        connect is None when the request reused a pooled connection
+        """
+        stats = self.platform_stats.setdefault(platform_name, {'probes': 0, 'hits': 0, 'errors': 0, 'total_time': 0.0})
+        latencies = stats.setdefault('latencies', [])
+        latencies.append([None if connect is None else round(connect, 4), round(first_byte, 4), round(total, 4)])
+        del latencies[:-self.LATENCY_WINDOW]
+    
+    def _platform_timeout(self, platform_name: str) -> Optional[aiohttp.ClientTimeout]:
+        """
+        Per-platform timeout learned from observed latency percentiles
+        The connect limit follows connection set-up time, the read limit time
+        to first byte and the total limit the full download. Returns None
+        (session default) until enough samples have been seen.
+        """
+        if not self.adaptive_timeouts:
+            return None
+        latencies = self.platform_stats.get(platform_name, {}).get('latencies', [])
+        if len(latencies) < self.ADAPTIVE_MIN_SAMPLES:
+            return None
+        # History written before connect timing was recorded has no connect column
+        latencies = [sample if len(sample) == 3 else [None] + sample for sample in latencies]
+        
+        def limit(samples):
+            samples = sorted(samples)
+            index = min(len(samples) - 1, int(len(samples) * self.ADAPTIVE_PERCENTILE))
+            return max(self.ADAPTIVE_FLOOR, min(self.timeout, samples[index] * self.ADAPTIVE_MARGIN))
+        
+        first_byte = limit(sample[1] for sample in latencies)
+        connects = [sample[0] for sample in latencies if sample[0] is not None]
+        # Mostly reused connections: too few connect samples, so bound it by first byte
+        connect = limit(connects) if len(connects) >= self.ADAPTIVE_MIN_SAMPLES else first_byte
+        return aiohttp.ClientTimeout(
+            total=limit(sample[2] for sample in latencies),
+            sock_connect=connect,
+            sock_read=first_byte
+        )
+    
+    def _platform_priority(self, platform_name: str) -> float:
+        """
+        Expected hits per second of probing for a platform
+        Unseen platforms get a neutral prior so they are still tried early
+        """
+        stats = self.platform_stats.get(platform_name, {})
+        probes = stats.get('probes', 0)
+        hit_rate = (stats.get('hits', 0) + 1) / (probes + 2)
+        avg_latency = stats['total_time'] / probes if probes else 1.0
+        return hit_rate / (avg_latency + 0.1)
+    
+    def _load_platform_stats(self) -> Dict:
+        """Load historical platform statistics from the history file"""
+        if not self.history_file:
+            return {}
+        try:
+            with open(self.history_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_platform_stats(self):
+        """Persist historical platform statistics to the history file"""
+        if not self.history_file:
+            return
+        try:
+            path = Path(self.history_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(self.platform_stats, f)
+        except OSError:
+            pass
+    
+    async def run_targets(self, usernames: List[str] = None, email: str = None, phone: str = None,
+                          domain: str = None, categories: List[str] = None,
+                          deadline: Optional[float] = None) -> List[OSINTResult]:
+        """
+        Run every requested analysis concurrently on one event loop
+        Blocking email, phone and domain lookups run in the default executor,
+        so the total time is that of the slowest part rather than the sum.
+        Results are recorded in a fixed order: usernames, email, phone, domain.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.time()
+        start_index = len(self.results)
+        
+        async def scan_usernames():
+            results = []
+            for username in usernames:
+                # One budget shared across the whole batch of scans
+                budget = None if deadline is None else deadline - (time.time() - started)
+                results.extend(await self.scan_username(username, categories, deadline=budget))
+            return results
+        
+        parts = []
+        if usernames:
+            parts.append(scan_usernames())
+        for analyzer, target in ((self.analyze_email, email), (self.analyze_phone, phone),
+                                 (self.analyze_domain, domain)):
+            if target:
+                parts.append(loop.run_in_executor(None, analyzer, target))
+        
+        owns_session = self.session is None or self.session.closed
+        if owns_session and usernames:
+            await self.start()
+        try:
+            outputs = await asyncio.gather(*parts)
+        finally:
+            if owns_session:
+                await self.close()
+        
+        ordered = []
+        for output in outputs:
+            ordered.extend(output if isinstance(output, list) else [output])
+        
+        # Parts append to self.results as they finish; restore the fixed order
+        self.results[start_index:] = ordered
+        return ordered
+    
     def analyze_email(self, email: str) -> OSINTResult:
         """
         Analyze email address for OSINT data
@@ -285,13 +1279,9 @@ class NinjaEye:
         
         # Check domain MX records
         if result_data['domain']:
-            try:
-                mx_records = dns.resolver.resolve(result_data['domain'], 'MX')
-                result_data['mx_records'] = [str(record) for record in mx_records]
-                result_data['domain_valid'] = True
-            except:
-                result_data['mx_records'] = []
-                result_data['domain_valid'] = False
+            mx_records = self._resolve_records(result_data['domain'], 'MX')
+            result_data['mx_records'] = mx_records or []
+            result_data['domain_valid'] = mx_records is not None
         
         # Check for common email breaches (simulated)
         result_data['breach_check'] = self._check_email_breaches(email)
@@ -310,11 +1300,70 @@ class NinjaEye:
         self.results.append(result)
         return result
     
+    def _resolve_records(self, domain: str, record_type: str) -> Optional[List[str]]:
+        """
+        Resolve DNS records through the shared cache, honoring the record TTL
+        Returns None when there are no records or the lookup failed
+        """
+        key = f"{record_type}:{domain.lower()}"
+        cached = self.resolution_cache.get(key)
+        if cached is not ResolutionCache.MISSING:
+            return cached
+        
+        try:
+            answer = dns.resolver.resolve(domain, record_type)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            self.resolution_cache.set(key, None, self.NEGATIVE_DNS_TTL)
+            return None
+        except Exception:
+            # Timeouts and server failures are transient; don't cache them
+            return None
+        
+        records = [str(record) for record in answer]
+        self.resolution_cache.set(key, records, answer.rrset.ttl)
+        return records
+    
+    def _resolve_host(self, domain: str) -> List[str]:
+        """Resolve a host's IP addresses through the shared cache"""
+        key = f"HOST:{domain.lower()}"
+        cached = self.resolution_cache.get(key)
+        if cached is not ResolutionCache.MISSING:
+            return cached
+        
+        ip_addresses = socket.gethostbyname_ex(domain)[2]
+        self.resolution_cache.set(key, ip_addresses, self.HOST_TTL)
+        return ip_addresses
+    
+    def _lookup_whois(self, domain: str) -> dict:
+        """Look up WHOIS data through the shared cache, kept for whois_ttl seconds"""
+        key = f"WHOIS:{domain.lower()}"
+        cached = self.resolution_cache.get(key)
+        if cached is not ResolutionCache.MISSING:
+            return cached
+        
+        whois_data = whois.whois(domain)
+        name_servers = whois_data.name_servers
+        whois_result = {
+            'registrar': whois_data.registrar,
+            'creation_date': str(whois_data.creation_date) if whois_data.creation_date else None,
+            'expiration_date': str(whois_data.expiration_date) if whois_data.expiration_date else None,
+            'name_servers': list(name_servers) if isinstance(name_servers, (list, set, tuple)) else name_servers
+        }
+        self.resolution_cache.set(key, whois_result, self.whois_ttl)
+        return whois_result
+    
     def _check_email_breaches(self, email: str) -> dict:
         """Check if email has been involved in data breaches"""
-        # This would typically call an API like HaveIBeenPwned
-        # For now, we'll simulate the check
-        email_hash = hashlib.sha256(email.encode()).hexdigest()
+        if self.breach_index is not None:
+            breaches = self.breach_index.lookup(email)
+            return {
+                'found_in_breaches': bool(breaches),
+                'breach_count': len(breaches),
+                'breaches': breaches,
+                'source': 'local_index'
+            }
+        
+        # Without a local index (see build-breach-index) the check is simulated
         
         # Simulated breach data
         simulated_breaches = {
@@ -327,7 +1376,8 @@ class NinjaEye:
         breach_result = {
             'found_in_breaches': False,
             'breach_count': 0,
-            'breaches': []
+            'breaches': [],
+            'source': 'simulated'
         }
         
         # Simulate random breach detection for demonstration
@@ -344,24 +1394,86 @@ class NinjaEye:
         Analyze phone number for OSINT data
         Feature not present in Aliens_Eye
         """
+        result = self._phone_result(phone, self._classify_phone(phone))
+        
+        self.results.append(result)
+        return result
+    
+    def analyze_phones(self, phones: Iterable[str]) -> Iterator[OSINTResult]:
+        """
+        Classify phone numbers in bulk, yielding one result per unique number
+        Numbers are deduplicated on their normalized form and results are
+        streamed rather than stored on self.results to keep memory flat
+        """
+        seen = set()
+        for phone in phones:
+            phone = phone.strip()
+            if not phone:
+                continue
+            
+            result_data = self._classify_phone(phone)
+            if result_data['cleaned'] in seen:
+                continue
+            seen.add(result_data['cleaned'])
+            
+            yield self._phone_result(phone, result_data)
+    
+    def _classify_phone(self, phone: str) -> dict:
+        """Split a phone number into country code and national number and classify it"""
         # Clean phone number
-        cleaned_phone = re.sub(r'[^\d+]', '', phone)
+        cleaned_phone = PHONE_STRIP_PATTERN.sub('', phone)
+        if cleaned_phone.startswith('00'):
+            cleaned_phone = '+' + cleaned_phone[2:]
         
         result_data = {
             'original': phone,
             'cleaned': cleaned_phone,
             'valid_format': False,
             'country_code': None,
+            'country': None,
+            'national_number': None,
             'type': None
         }
         
-        # Basic validation
-        if cleaned_phone.startswith('+') and len(cleaned_phone) >= 10:
+        if not cleaned_phone.startswith('+') or '+' in cleaned_phone[1:]:
+            return result_data
+        
+        # Country codes are prefix-free, so the first terminal node is the match
+        digits = cleaned_phone[1:]
+        node = COUNTRY_CODE_TRIE
+        country_code = None
+        for digit in digits[:3]:
+            node = node.get(digit)
+            if node is None:
+                break
+            country_code = node.get(None)
+            if country_code:
+                break
+        
+        if country_code is None:
+            return result_data
+        
+        country, min_length, max_length = COUNTRY_CALLING_CODES[country_code]
+        national_number = digits[len(country_code):]
+        result_data['country_code'] = country_code
+        result_data['country'] = country
+        result_data['national_number'] = national_number
+        
+        if min_length <= len(national_number) <= max_length:
             result_data['valid_format'] = True
-            result_data['country_code'] = cleaned_phone[1:3]
-            result_data['type'] = 'mobile' if len(cleaned_phone) >= 12 else 'landline'
+            if country_code in SHARED_MOBILE_RANGES:
+                result_data['type'] = 'fixed_or_mobile'
+            elif country_code in MOBILE_PREFIXES:
+                is_mobile = national_number.startswith(MOBILE_PREFIXES[country_code])
+                result_data['type'] = 'mobile' if is_mobile else 'landline'
+            else:
+                result_data['type'] = 'unknown'
         
-        result = OSINTResult(
+        return result_data
+    
+    def _phone_result(self, phone: str, result_data: dict) -> OSINTResult:
+        """Wrap classified phone data in an OSINTResult"""
+        return OSINTResult(
             source='phone_analysis',
             target=phone,
             result_type='phone_analysis',
@@ -371,9 +1483,6 @@ class NinjaEye:
             timestamp=datetime.now().isoformat(),
             metadata={'analysis_type': 'phone_intelligence'}
         )
-        
-        self.results.append(result)
-        return result
     
     def analyze_domain(self, domain: str) -> OSINTResult:
         """
@@ -391,27 +1500,18 @@ class NinjaEye:
         
         try:
             # Get IP addresses
-            ip_addresses = socket.gethostbyname_ex(domain)
-            result_data['ip_addresses'] = ip_addresses[2]
+            result_data['ip_addresses'] = self._resolve_host(domain)
             
             # Get DNS records
             record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'SOA']
             for record_type in record_types:
-                try:
-                    records = dns.resolver.resolve(domain, record_type)
-                    result_data['dns_records'][record_type] = [str(record) for record in records]
-                except:
-                    pass
+                records = self._resolve_records(domain, record_type)
+                if records is not None:
+                    result_data['dns_records'][record_type] = records
             
             # Get WHOIS data
             try:
-                whois_data = whois.whois(domain)
-                result_data['whois_data'] = {
-                    'registrar': whois_data.registrar,
-                    'creation_date': str(whois_data.creation_date) if whois_data.creation_date else None,
-                    'expiration_date': str(whois_data.expiration_date) if whois_data.expiration_date else None,
-                    'name_servers': whois_data.name_servers
-                }
+                result_data['whois_data'] = self._lookup_whois(domain)
             except:
                 pass
             
@@ -502,6 +1602,8 @@ class NinjaEye:
                     'maybe': len([r for r in self.results if r.status == 'MAYBE']),
                     'not_found': len([r for r in self.results if r.status == 'NOT_FOUND']),
                     'errors': len([r for r in self.results if r.status == 'ERROR']),
+                    'timeout_budget': len([r for r in self.results if r.status == 'TIMEOUT_BUDGET']),
+                    'resolution_cache': self.resolution_cache.stats(),
                     'timestamp': datetime.now().isoformat()
                 },
                 'results': [asdict(result) for result in self.results]
@@ -520,6 +1622,7 @@ class NinjaEye:
             found = len([r for r in self.results if r.status == 'FOUND'])
             maybe = len([r for r in self.results if r.status == 'MAYBE'])
             not_found = len([r for r in self.results if r.status == 'NOT_FOUND'])
+            timeout_budget = len([r for r in self.results if r.status == 'TIMEOUT_BUDGET'])
             
             report_lines.append("SUMMARY")
             report_lines.append("-" * 40)
@@ -527,6 +1630,12 @@ class NinjaEye:
             report_lines.append(f"Found: {found}")
             report_lines.append(f"Maybe: {maybe}")
             report_lines.append(f"Not Found: {not_found}")
+            if timeout_budget:
+                report_lines.append(f"Deadline Reached: {timeout_budget}")
+            cache_stats = self.resolution_cache.stats()
+            if cache_stats['hits'] or cache_stats['misses']:
+                report_lines.append(f"DNS/WHOIS Cache: {cache_stats['hits']} hits, "
+                                    f"{cache_stats['misses']} misses ({cache_stats['hit_rate']}% hit rate)")
             report_lines.append("")
             
             # Detailed results
@@ -539,6 +1648,7 @@ class NinjaEye:
                     'MAYBE': '?',
                     'NOT_FOUND': '✗',
                     'ERROR': '!',
+                    'TIMEOUT_BUDGET': '⌛',
                     'COMPLETE': '✓'
                 }.get(result.status, '?')
                 
@@ -560,12 +1670,276 @@ class NinjaEye:
     
     def save_report(self, filename: str, output_format: str = 'json'):
         """Save report to file"""
+        if output_format in COLUMNAR_FORMATS:
+            self.export_results(self.results, filename, output_format)
+            return filename
+        
         report = self.generate_report(output_format)
         
         with open(filename, 'w') as f:
             f.write(report)
         
         return filename
+    
+    def export_results(self, results: Iterable[OSINTResult], filename: str,
+                       output_format: str = 'csv', chunk_size: int = 50000) -> int:
+        """
+        Write results as flat columns (csv, parquet or arrow)
+        Results are consumed and written chunk_size rows at a time so any
+        iterable, including a generator, can be exported in bounded memory
+        """
+        with ResultExporter(filename, output_format, chunk_size) as exporter:
+            for result in results:
+                exporter.write(result)
+        return exporter.written
+
+@dataclass
+class ScanJob:
+    """A queued scan submitted through the serve-mode HTTP API"""
+    job_id: str
+    job_type: str
+    target: str
+    categories: Optional[List[str]] = None
+    deadline: Optional[float] = None
+    status: str = 'QUEUED'
+    results: List[OSINTResult] = field(default_factory=list)
+    error: Optional[str] = None
+    created: str = field(default_factory=lambda: datetime.now().isoformat())
+    finished: Optional[str] = None
+    
+    def __post_init__(self):
+        self._changed = asyncio.Event()
+    
+    @property
+    def done(self) -> bool:
+        return self.status in ('COMPLETE', 'ERROR')
+    
+    def add_result(self, result: OSINTResult):
+        """Record a result and wake any streaming readers"""
+        self.results.append(result)
+        self._notify()
+    
+    def finish(self, status: str, error: Optional[str] = None):
+        """Mark the job finished and wake any streaming readers"""
+        self.status = status
+        self.error = error
+        self.finished = datetime.now().isoformat()
+        self._notify()
+    
+    def _notify(self):
+        # Swap in a fresh event so readers that grabbed the old one all wake up
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+    
+    def summary(self) -> dict:
+        return {
+            'job_id': self.job_id,
+            'type': self.job_type,
+            'target': self.target,
+            'categories': self.categories,
+            'deadline': self.deadline,
+            'status': self.status,
+            'result_count': len(self.results),
+            'error': self.error,
+            'created': self.created,
+            'finished': self.finished
+        }
+
+class NinjaEyeServer:
+    """
+    Long-running HTTP/JSON job service around a warm NinjaEye instance
+    Keeps the connection pool, platform registry and caches alive between
+    lookups instead of paying process startup and cold connections per scan
+    """
+    
+    JOB_TYPES = ('username', 'email', 'phone', 'domain')
+    
+    def __init__(self, ninja: NinjaEye, workers: int = 4, queue_size: int = 1000, max_jobs: int = 1000):
+        self.ninja = ninja
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_jobs = max_jobs
+        self.jobs = OrderedDict()
+        self.queue = None
+        self._worker_tasks = []
+    
+    def create_app(self) -> web.Application:
+        """Build the aiohttp application with job routes"""
+        app = web.Application()
+        app.router.add_get('/health', self.handle_health)
+        app.router.add_post('/jobs', self.handle_submit)
+        app.router.add_get('/jobs', self.handle_list)
+        app.router.add_get('/jobs/{job_id}', self.handle_get)
+        app.router.add_get('/jobs/{job_id}/stream', self.handle_stream)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+    
+    async def _on_startup(self, app):
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        await self.ninja.start()
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+    
+    async def _on_cleanup(self, app):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        await self.ninja.close()
+        self.ninja.resolution_cache.save()
+    
+    async def _worker(self):
+        """Pull jobs off the queue and run them against the shared instance"""
+        while True:
+            job = await self.queue.get()
+            try:
+                await self._run_job(job)
+            finally:
+                self.queue.task_done()
+    
+    async def _run_job(self, job: ScanJob):
+        job.status = 'RUNNING'
+        try:
+            if job.job_type == 'username':
+                await self.ninja.scan_username(job.target, job.categories, on_result=job.add_result,
+                                               deadline=job.deadline)
+            else:
+                analyzer = {
+                    'email': self.ninja.analyze_email,
+                    'phone': self.ninja.analyze_phone,
+                    'domain': self.ninja.analyze_domain
+                }[job.job_type]
+                # Email and domain lookups block on DNS/WHOIS/SSL sockets
+                loop = asyncio.get_running_loop()
+                job.add_result(await loop.run_in_executor(None, analyzer, job.target))
+            job.finish('COMPLETE')
+        except Exception as e:
+            job.finish('ERROR', str(e))
+        finally:
+            # Results live on the job; don't let the shared instance grow forever
+            self.ninja.results.clear()
+    
+    def _remember(self, job: ScanJob):
+        """Store a job, evicting the oldest finished jobs beyond max_jobs"""
+        self.jobs[job.job_id] = job
+        while len(self.jobs) > self.max_jobs:
+            oldest = next((jid for jid, j in self.jobs.items() if j.done), None)
+            if oldest is None:
+                break
+            del self.jobs[oldest]
+    
+    async def handle_health(self, request):
+        return web.json_response({
+            'status': 'ok',
+            'platforms': sum(len(p) for p in self.ninja.platforms.values()),
+            'queued': self.queue.qsize(),
+            'jobs': len(self.jobs),
+            'resolution_cache': self.ninja.resolution_cache.stats()
+        })
+    
+    async def handle_submit(self, request):
+        try:
+            payload = await request.json()
+        except Exception:
+            return web.json_response({'error': 'Request body must be JSON'}, status=400)
+        if not isinstance(payload, dict):
+            return web.json_response({'error': 'Request body must be a JSON object'}, status=400)
+        
+        job_type = payload.get('type')
+        target = payload.get('target')
+        categories = payload.get('categories')
+        deadline = payload.get('deadline')
+        
+        if job_type not in self.JOB_TYPES:
+            return web.json_response({'error': f"type must be one of {', '.join(self.JOB_TYPES)}"}, status=400)
+        if not target or not isinstance(target, str):
+            return web.json_response({'error': 'target is required'}, status=400)
+        if categories is not None:
+            if not isinstance(categories, list) or not all(isinstance(c, str) for c in categories):
+                return web.json_response({'error': 'categories must be a list of strings'}, status=400)
+            unknown = [c for c in categories if c not in self.ninja.platforms]
+            if unknown:
+                return web.json_response({'error': f"Unknown categories: {', '.join(unknown)}"}, status=400)
+        if deadline is not None and (not isinstance(deadline, (int, float)) or deadline <= 0):
+            return web.json_response({'error': 'deadline must be a positive number of seconds'}, status=400)
+        
+        job = ScanJob(job_id=uuid.uuid4().hex, job_type=job_type, target=target,
+                      categories=categories, deadline=deadline)
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            return web.json_response({'error': 'Job queue is full'}, status=503)
+        
+        self._remember(job)
+        return web.json_response(job.summary(), status=202)
+    
+    async def handle_list(self, request):
+        return web.json_response({'jobs': [job.summary() for job in self.jobs.values()]})
+    
+    async def handle_get(self, request):
+        job = self.jobs.get(request.match_info['job_id'])
+        if job is None:
+            return web.json_response({'error': 'Unknown job'}, status=404)
+        
+        response = job.summary()
+        response['results'] = [asdict(result) for result in job.results]
+        return web.json_response(response)
+    
+    async def handle_stream(self, request):
+        """Stream job results as newline-delimited JSON while they complete"""
+        job = self.jobs.get(request.match_info['job_id'])
+        if job is None:
+            return web.json_response({'error': 'Unknown job'}, status=404)
+        
+        response = web.StreamResponse(headers={'Content-Type': 'application/x-ndjson'})
+        await response.prepare(request)
+        
+        sent = 0
+        while True:
+            changed = job._changed
+            while sent < len(job.results):
+                line = json.dumps({'result': asdict(job.results[sent])})
+                await response.write(line.encode() + b'\n')
+                sent += 1
+            if job.done:
+                break
+            await changed.wait()
+        
+        await response.write(json.dumps({'job': job.summary()}).encode() + b'\n')
+        await response.write_eof()
+        return response
+
+def run_watch_loop(ninja: NinjaEye, args):
+    """Run watch passes over the watchlist, printing only status changes"""
+    watchlist = [args.username] if args.username else []
+    if args.username_file:
+        handles = sys.stdin if args.username_file == '-' else open(args.username_file)
+        try:
+            watchlist.extend(line.strip() for line in handles if line.strip())
+        finally:
+            if handles is not sys.stdin:
+                handles.close()
+    
+    print(f"👁  Watching {len(watchlist)} username(s), state in: {args.watch_state}")
+    
+    while True:
+        transitions = asyncio.run(ninja.watch_usernames(watchlist, args.categories, args.watch_state))
+        
+        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {len(transitions)} change(s), "
+              f"{ninja.watch_errors} failed probe(s)")
+        for result in transitions:
+            previous = result.metadata.get('previous_status') or 'UNSEEN'
+            print(f"   🔁 {result.source.upper()} {result.target}: {previous} -> {result.status} ({result.data['url']})")
+        
+        if args.output and transitions:
+            # Each pass replaces the report with that pass's changes
+            ninja.results = transitions
+            ninja.save_report(args.output, args.format)
+            print(f"💾 Changes saved to: {args.output}")
+        ninja.results = []
+        
+        if not args.watch_interval:
+            break
+        time.sleep(args.watch_interval)
 
 def main():
     """Main entry point"""
@@ -586,97 +1960,283 @@ Examples:
   # Analyze phone number
   python ninjai_eye.py --phone +1234567890
   
+  # Classify a file of phone numbers (one per line) as JSON lines
+  python ninjai_eye.py --phone-file numbers.txt --stream-output numbers.jsonl
+  
+  # Scan a large list of usernames with constant memory
+  python ninjai_eye.py --username-file handles.txt --stream-output results.jsonl
+  
+  # Export a large scan as Parquet in bounded memory
+  python ninjai_eye.py --username-file handles.txt --format parquet --output results.parquet
+  
   # Analyze domain
   python ninjai_eye.py --domain example.com
   
   # Generate variations and scan
   python ninjai_eye.py --username johndoe --variations
   
+  # Return whatever is known after 3 seconds
+  python ninjai_eye.py --username johndoe --deadline 3
+  
+  # Report only profiles whose status changed since the last check
+  python ninjai_eye.py --username-file watchlist.txt --watch --watch-interval 3600
+  
   # Save report to file
   python ninjai_eye.py --username johndoe --output report.json
+  
+  # Export flat columns for analytics tooling
+  python ninjai_eye.py --username johndoe --format parquet --output results.parquet
+  
+  # Build a local breach index and check emails against it
+  python ninjai_eye.py build-breach-index --breach-index breaches.idx --breach-source linkedin:2021-06-22=linkedin.txt
+  python ninjai_eye.py --email john@example.com --breach-index breaches.idx
+  
+  # Run as a local HTTP/JSON job service
+  python ninjai_eye.py serve --port 8765
         """
     )
     
+    parser.add_argument('mode', nargs='?', choices=['scan', 'serve', 'build-breach-index'], default='scan',
+                       help='scan runs once from the command line, serve starts the HTTP job API, '
+                            'build-breach-index writes --breach-index from --breach-source files (default: scan)')
     parser.add_argument('--username', help='Username to scan')
     parser.add_argument('--email', help='Email address to analyze')
     parser.add_argument('--phone', help='Phone number to analyze')
+    parser.add_argument('--phone-file', help='File of phone numbers to classify, one per line (- for stdin)')
+    parser.add_argument('--username-file', help='File of usernames to scan, one per line (- for stdin)')
+    parser.add_argument('--stream-output',
+                       help='Where to stream --phone-file and --username-file results as JSON lines '
+                            '(default: stdout, unless they are exported with --output)')
     parser.add_argument('--domain', help='Domain to analyze')
     parser.add_argument('--categories', nargs='+', 
                        choices=['social_media', 'forums', 'professional', 'gaming'],
                        help='Categories to scan')
     parser.add_argument('--variations', action='store_true',
                        help='Generate and scan username variations')
+    parser.add_argument('--watch', action='store_true',
+                       help='Re-check --username/--username-file profiles and report only status changes')
+    parser.add_argument('--watch-state', default=str(Path.home() / '.ninjai_eye' / 'watch_state.json'),
+                       help='File storing the last state of watched profiles')
+    parser.add_argument('--watch-interval', type=float,
+                       help='Repeat the watch pass every N seconds instead of running once')
     parser.add_argument('--output', help='Output file for report')
-    parser.add_argument('--format', choices=['json', 'text'], default='text',
-                       help='Output format (default: text)')
+    parser.add_argument('--format', choices=['json', 'text', 'csv', 'parquet', 'arrow'], default='text',
+                       help='Output format (default: text); csv, parquet and arrow write flat columns and need --output')
     parser.add_argument('--max-concurrent', type=int, default=50,
                        help='Maximum concurrent connections (default: 50)')
     parser.add_argument('--timeout', type=int, default=10,
                        help='Request timeout in seconds (default: 10)')
+    parser.add_argument('--deadline', type=float,
+                       help='Time budget in seconds for username scans (per username with --username-file); '
+                            'unfinished probes are marked TIMEOUT_BUDGET')
+    parser.add_argument('--history-file', default=str(Path.home() / '.ninjai_eye' / 'platform_history.json'),
+                       help='File storing per-platform hit rate and latency used to prioritize probes and learn timeouts')
+    parser.add_argument('--no-adaptive-timeouts', action='store_true',
+                       help='Use --timeout for every platform instead of per-platform learned timeouts')
+    parser.add_argument('--breach-index', help='Local breach index used for email breach checks')
+    parser.add_argument('--breach-source', action='append', default=[], metavar='NAME[:DATE]=PATH',
+                       help='Breach identifier file (one email per line) for build-breach-index; repeatable')
+    parser.add_argument('--no-prefix-index', action='store_true',
+                       help='Build the breach index without its two-byte prefix table')
+    parser.add_argument('--cache-file', help='Persist the DNS/WHOIS resolution cache to this file between runs')
+    parser.add_argument('--cache-size', type=int, default=10000,
+                       help='Maximum DNS/WHOIS cache entries (default: 10000)')
+    parser.add_argument('--whois-ttl', type=float, default=86400,
+                       help='Seconds to reuse WHOIS answers (default: 86400)')
+    parser.add_argument('--host', default='127.0.0.1',
+                       help='Address to bind in serve mode (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765,
+                       help='Port to bind in serve mode (default: 8765)')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Concurrent jobs in serve mode (default: 4)')
     
     args = parser.parse_args()
     
-    if not any([args.username, args.email, args.phone, args.domain]):
+    if args.format in COLUMNAR_FORMATS and not args.output:
+        parser.error(f"--format {args.format} requires --output")
+    if args.format in ('parquet', 'arrow') and pyarrow is None:
+        parser.error(f"--format {args.format} requires pyarrow (pip install pyarrow)")
+    
+    if args.watch and not (args.username or args.username_file):
+        parser.error("--watch requires --username or --username-file")
+    if args.watch and args.deadline is not None:
+        parser.error("--watch cannot be combined with --deadline")
+    if args.watch and args.variations:
+        parser.error("--watch cannot be combined with --variations")
+    if args.watch and any([args.email, args.phone, args.phone_file, args.domain]):
+        parser.error("--watch cannot be combined with --email, --phone, --phone-file or --domain")
+    
+    # Streamed results can only be exported row by row, not as a report
+    if (args.username_file or args.phone_file) and args.output and not args.watch:
+        if args.format not in COLUMNAR_FORMATS:
+            parser.error("--output with --username-file or --phone-file requires --format csv, parquet or arrow")
+        if any([args.username, args.email, args.phone, args.domain]):
+            parser.error("--output with --username-file or --phone-file cannot be combined with "
+                         "--username, --email, --phone or --domain")
+    
+    if args.mode == 'build-breach-index':
+        if not args.breach_index or not args.breach_source:
+            parser.error("build-breach-index requires --breach-index and at least one --breach-source")
+        
+        sources = []
+        for spec in args.breach_source:
+            label, sep, path = spec.partition('=')
+            if not sep:
+                parser.error(f"--breach-source must look like NAME[:DATE]=PATH, got {spec}")
+            name, _, date = label.partition(':')
+            handle = open(path, errors='replace')
+            sources.append(({'name': name, 'date': date or None}, handle))
+        
+        print(f"🔨 Building breach index: {args.breach_index}")
+        try:
+            count = BreachIndex.build(args.breach_index, sources, prefix_index=not args.no_prefix_index)
+        finally:
+            for _, handle in sources:
+                handle.close()
+        print(f"✅ Indexed {count} records from {len(sources)} breach source(s)")
+        return
+    
+    if args.mode == 'serve':
+        ninja = NinjaEye(max_concurrent=args.max_concurrent, timeout=args.timeout,
+                         history_file=args.history_file, breach_index=args.breach_index,
+                         cache_file=args.cache_file, cache_size=args.cache_size, whois_ttl=args.whois_ttl,
+                         adaptive_timeouts=not args.no_adaptive_timeouts)
+        server = NinjaEyeServer(ninja, workers=args.workers)
+        print(f"🥷 NinjaEye job API listening on http://{args.host}:{args.port}")
+        web.run_app(server.create_app(), host=args.host, port=args.port, print=None)
+        return
+    
+    if not any([args.username, args.username_file, args.email, args.phone, args.phone_file, args.domain]):
         parser.print_help()
         sys.exit(1)
     
     # Initialize NinjaEye
-    ninja = NinjaEye(max_concurrent=args.max_concurrent, timeout=args.timeout)
+    ninja = NinjaEye(max_concurrent=args.max_concurrent, timeout=args.timeout,
+                     history_file=args.history_file, breach_index=args.breach_index,
+                     cache_file=args.cache_file, cache_size=args.cache_size, whois_ttl=args.whois_ttl,
+                     adaptive_timeouts=not args.no_adaptive_timeouts)
+    
+    streaming = bool(args.phone_file or args.username_file) and not args.watch
+    stream_only = streaming and not any([args.username, args.email, args.phone, args.domain])
+    exporting = streaming and bool(args.output)
+    stream_output = args.stream_output or (None if exporting else '-')
+    # Keep stdout valid JSON lines when results stream there
+    console = sys.stderr if streaming and stream_output == '-' else sys.stdout
     
-    print("\n" + "=" * 80)
-    print("🥷 NINJAEYE - Advanced OSINT Framework")
-    print("=" * 80)
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    if not stream_only:
+        print("\n" + "=" * 80, file=console)
+        print("🥷 NINJAEYE - Advanced OSINT Framework", file=console)
+        print("=" * 80, file=console)
+        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=console)
+        print(file=console)
+    
+    if args.watch:
+        run_watch_loop(ninja, args)
+        return
     
     # Execute scans based on arguments
+    usernames = []
     if args.username:
-        print(f"🔍 Scanning username: {args.username}")
+        print(f"🔍 Scanning username: {args.username}", file=console)
         
         if args.variations:
-            print("🔄 Generating username variations...")
+            print("🔄 Generating username variations...", file=console)
             variations = ninja.generate_username_variations(args.username)
-            print(f"📋 Generated {len(variations)} variations")
-            
-            for i, variation in enumerate(variations[:5], 1):  # Scan first 5 variations
-                print(f"\n🔍 Scanning variation {i}/{min(5, len(variations))}: {variation}")
-                asyncio.run(ninja.scan_username(variation, args.categories))
+            print(f"📋 Generated {len(variations)} variations", file=console)
+            usernames = variations[:5]  # Scan first 5 variations
+            print(f"🔍 Scanning variations: {', '.join(usernames)}", file=console)
         else:
-            asyncio.run(ninja.scan_username(args.username, args.categories))
-        
-        print(f"✅ Username scan completed")
+            usernames = [args.username]
     
     if args.email:
-        print(f"\n📧 Analyzing email: {args.email}")
-        ninja.analyze_email(args.email)
-        print(f"✅ Email analysis completed")
+        print(f"📧 Analyzing email: {args.email}", file=console)
     
     if args.phone:
-        print(f"\n📱 Analyzing phone: {args.phone}")
-        ninja.analyze_phone(args.phone)
-        print(f"✅ Phone analysis completed")
+        print(f"📱 Analyzing phone: {args.phone}", file=console)
     
     if args.domain:
-        print(f"\n🌐 Analyzing domain: {args.domain}")
-        ninja.analyze_domain(args.domain)
-        print(f"✅ Domain analysis completed")
+        print(f"🌐 Analyzing domain: {args.domain}", file=console)
+    
+    if usernames or args.email or args.phone or args.domain:
+        asyncio.run(ninja.run_targets(usernames=usernames, email=args.email, phone=args.phone,
+                                      domain=args.domain, categories=args.categories,
+                                      deadline=args.deadline))
+        
+        if usernames:
+            print(f"✅ Username scan completed", file=console)
+        if args.email:
+            print(f"✅ Email analysis completed", file=console)
+        if args.phone:
+            print(f"✅ Phone analysis completed", file=console)
+        if args.domain:
+            print(f"✅ Domain analysis completed", file=console)
+        
+        ninja.resolution_cache.save()
+    
+    if streaming:
+        output = None
+        if stream_output:
+            output = sys.stdout if stream_output == '-' else open(stream_output, 'w')
+        exporter = ResultExporter(args.output, args.format) if exporting else None
+        
+        def write_result(result):
+            if output:
+                output.write(json.dumps(asdict(result)) + '\n')
+            if exporter:
+                exporter.write(result)
+        
+        try:
+            if args.phone_file:
+                print(f"📱 Classifying phone numbers from: {args.phone_file}", file=console)
+                phones = sys.stdin if args.phone_file == '-' else open(args.phone_file)
+                count = 0
+                try:
+                    for result in ninja.analyze_phones(phones):
+                        write_result(result)
+                        count += 1
+                finally:
+                    if phones is not sys.stdin:
+                        phones.close()
+                print(f"✅ Classified {count} unique phone numbers", file=console)
+            
+            if args.username_file:
+                print(f"🔍 Scanning usernames from: {args.username_file}", file=console)
+                handles = sys.stdin if args.username_file == '-' else open(args.username_file)
+                try:
+                    usernames = (line.strip() for line in handles if line.strip())
+                    count = asyncio.run(ninja.scan_stream(usernames, write_result, args.categories,
+                                                          deadline=args.deadline))
+                finally:
+                    if handles is not sys.stdin:
+                        handles.close()
+                print(f"✅ Streamed {count} username results", file=console)
+        finally:
+            if output is not None and output is not sys.stdout:
+                output.close()
+            if exporter:
+                exporter.close()
+                print(f"💾 Exported {exporter.written} results to: {args.output}", file=console)
+    
+    if stream_only:
+        return
     
     # Generate and display report
-    print("\n" + "=" * 80)
-    print("📊 SCAN RESULTS")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=console)
+    print("📊 SCAN RESULTS", file=console)
+    print("=" * 80, file=console)
     
-    report = ninja.generate_report(args.format)
-    print(report)
+    # Columnar formats are for files; show the text report on screen instead
+    report = ninja.generate_report('text' if args.format in COLUMNAR_FORMATS else args.format)
+    print(report, file=console)
     
     # Save report if requested
     if args.output:
         ninja.save_report(args.output, args.format)
-        print(f"\n💾 Report saved to: {args.output}")
+        print(f"\n💾 Report saved to: {args.output}", file=console)
     
-    print("\n" + "=" * 80)
-    print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 80 + "\n")
+    print("\n" + "=" * 80, file=console)
+    print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=console)
+    print("=" * 80 + "\n", file=console)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file